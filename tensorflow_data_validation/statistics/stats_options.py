@@ -19,17 +19,80 @@ from __future__ import division
 
 from __future__ import print_function
 
-import copy
 import json
+import logging
+import math
+import re
 import types as python_types
 
 from tensorflow_data_validation import types
 from tensorflow_data_validation.statistics.generators import stats_generator
-from typing import List, Optional, Text
+from typing import Any, Dict, List, Optional, Text
 
 from google.protobuf import json_format
 from tensorflow_metadata.proto.v0 import schema_pb2
 
+# orjson is an optional, faster JSON codec. Fall back to the standard library
+# json module if it is not installed.
+try:
+  import orjson  # pylint: disable=g-import-not-at-top
+except ImportError:
+  orjson = None
+
+
+def _json_dumps(obj: Dict[Text, Any]) -> Text:
+  """Serializes a flat dict to compact JSON, using orjson if available.
+
+  The json fallback uses the same separators as orjson and writes non-ASCII
+  characters as is. The output of both libraries decodes to the same values,
+  but the text may differ, e.g. in how floats are formatted.
+
+  Args:
+    obj: The dict to serialize.
+
+  Returns:
+    The JSON representation of obj.
+  """
+  # orjson writes NaN and infinity as null, so leave those to json, which
+  # writes them as NaN and Infinity.
+  if orjson is not None and all(
+      not isinstance(value, float) or math.isfinite(value)
+      for value in obj.values()):
+    try:
+      return orjson.dumps(obj).decode('utf-8')
+    except TypeError:
+      # orjson does not support e.g. integers that do not fit in 64 bits.
+      pass
+  return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+# Matches runs of 20 or more digits. These may encode integers that do not fit
+# in 64 bits, which orjson decodes as floats.
+_LONG_DIGIT_RUN_RE = re.compile(r'\d{20,}')
+
+
+def _json_loads(json_text: Text):
+  """Deserializes json_text, using orjson if it decodes it exactly as json."""
+  if orjson is not None and not _LONG_DIGIT_RUN_RE.search(json_text):
+    try:
+      return orjson.loads(json_text)
+    except orjson.JSONDecodeError:
+      # orjson rejects e.g. the NaN and Infinity tokens, which json accepts.
+      pass
+  return json.loads(json_text)
+
+
+def _slot_names(cls: type) -> List[Text]:
+  """Returns the names in the __slots__ of cls and its bases, bases first."""
+  names = []
+  for klass in reversed(cls.__mro__):
+    slots = klass.__dict__.get('__slots__', ())
+    if isinstance(slots, str):
+      slots = (slots,)
+    names.extend(
+        name for name in slots if name not in ('__dict__', '__weakref__'))
+  return names
+
 
 # TODO(b/68277922): Currently we use a single epsilon (error tolerance)
 # parameter for all histograms. Set this parameter specific to each
@@ -40,6 +103,17 @@ from tensorflow_metadata.proto.v0 import schema_pb2
 class StatsOptions(object):
   """Options for generating statistics."""
 
+  # The attribute names double as the keys of the JSON representation.
+  __slots__ = ('_generators', '_feature_whitelist', '_schema', 'weight_feature',
+               'label_feature', '_slice_functions', '_sample_count',
+               '_sample_rate', 'num_top_values', 'frequency_threshold',
+               'weighted_frequency_threshold', 'num_rank_histogram_buckets',
+               '_num_values_histogram_buckets', '_num_histogram_buckets',
+               '_num_quantiles_histogram_buckets', 'epsilon',
+               'infer_type_from_schema', '_desired_batch_size',
+               'enable_semantic_domain_stats',
+               '_semantic_domain_stats_sample_rate')
+
   def __init__(
       self,
       generators: Optional[List[stats_generator.StatsGenerator]] = None,
@@ -141,7 +215,7 @@ class StatsOptions(object):
     self.semantic_domain_stats_sample_rate = semantic_domain_stats_sample_rate
 
   def to_json(self) -> Text:
-    """Convert from an object to JSON representation of the __dict__ attribute.
+    """Convert from an object to JSON representation of its attributes.
 
     Custom generators and slice_functions are skipped, meaning that they will
     not be used when running TFDV in a setting where the stats options have been
@@ -149,35 +223,52 @@ class StatsOptions(object):
     TFX component. The schema proto will be json_encoded.
 
     Returns:
-      A JSON representation of a filtered version of __dict__.
+      A JSON representation of a filtered version of the attributes, keyed by
+      the names in the __slots__ of this class and its bases. Attributes that
+      subclasses store in their __dict__ are included as well.
     """
-    options_dict = copy.copy(self.__dict__)
+    options_dict = {
+        name: getattr(self, name)
+        for name in _slot_names(type(self))
+        if hasattr(self, name)
+    }
+    options_dict.update(getattr(self, '__dict__', {}))
     options_dict['_slice_functions'] = None
     options_dict['_generators'] = None
     if self.schema:
       del options_dict['_schema']
       options_dict['schema_json'] = json_format.MessageToJson(self.schema)
-    return json.dumps(options_dict)
+    return _json_dumps(options_dict)
 
   @classmethod
   def from_json(cls, options_json: Text) -> 'StatsOptions':
     """Construct an instance of stats options from a JSON representation.
 
     Args:
-      options_json: A JSON representation of the __dict__ attribute of a
-        StatsOptions instance.
+      options_json: A JSON representation of the attributes of a StatsOptions
+        instance, as produced by to_json.
 
     Returns:
-      A StatsOptions instance constructed by setting the __dict__ attribute to
-      the deserialized value of options_json.
+      A StatsOptions instance constructed by setting its attributes to the
+      deserialized values of options_json.
     """
-    options_dict = json.loads(options_json)
+    options_dict = _json_loads(options_json)
     if 'schema_json' in options_dict:
       options_dict['_schema'] = json_format.Parse(options_dict['schema_json'],
                                                   schema_pb2.Schema())
       del options_dict['schema_json']
-    options = cls()
-    options.__dict__ = options_dict
+    # The decoded values were validated when the options were serialized, so
+    # bypass __init__ and the property setters.
+    options = cls.__new__(cls)
+    slot_names = frozenset(_slot_names(cls))
+    # Subclasses without __slots__ have a __dict__ that can hold any key.
+    has_dict = hasattr(options, '__dict__')
+    for name, value in options_dict.items():
+      if name in slot_names or has_dict:
+        setattr(options, name, value)
+      else:
+        # The JSON may have been written by a different version of TFDV.
+        logging.warning('Ignoring unknown StatsOptions field "%s".', name)
     return options
 
   @property
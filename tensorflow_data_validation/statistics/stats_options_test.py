@@ -17,8 +17,10 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import math
+import re
+
 from absl.testing import absltest
-from absl.testing import parameterized
 from tensorflow_data_validation import types
 from tensorflow_data_validation.statistics import stats_options
 from tensorflow_data_validation.statistics.generators import lift_stats_generator
@@ -27,211 +29,200 @@ from tensorflow_data_validation.utils import slicing_util
 from tensorflow.python.util.protobuf import compare  # pylint: disable=g-direct-tensorflow-import
 from tensorflow_metadata.proto.v0 import schema_pb2
 
-INVALID_STATS_OPTIONS = [
-    {
-        'testcase_name': 'invalid_generators',
-        'stats_options_kwargs': {
-            'generators': {}
-        },
-        'exception_type': TypeError,
-        'error_message': 'generators is of type dict, should be a list.'
-    },
-    {
-        'testcase_name': 'invalid_generator',
-        'stats_options_kwargs': {
-            'generators': [{}]
-        },
-        'exception_type': TypeError,
-        'error_message': 'Statistics generator must extend one of '
-                         'CombinerStatsGenerator, TransformStatsGenerator, '
-                         'or CombinerFeatureStatsGenerator '
-                         'found object of type dict.'
-    },
-    {
-        'testcase_name': 'invalid_feature_whitelist',
-        'stats_options_kwargs': {
-            'feature_whitelist': {}
-        },
-        'exception_type': TypeError,
-        'error_message': 'feature_whitelist is of type dict, should be a list.'
-    },
-    {
-        'testcase_name': 'invalid_schema',
-        'stats_options_kwargs': {
-            'schema': {}
-        },
-        'exception_type': TypeError,
-        'error_message': 'schema is of type dict, should be a Schema proto.'
-    },
-    {
-        'testcase_name': 'invalid_slice_functions_list',
-        'stats_options_kwargs': {
-            'slice_functions': {}
-        },
-        'exception_type': TypeError,
-        'error_message': 'slice_functions is of type dict, should be a list.'
-    },
-    {
-        'testcase_name': 'invalid_slice_function_type',
-        'stats_options_kwargs': {
-            'slice_functions': [1]
-        },
-        'exception_type': TypeError,
-        'error_message': 'slice_functions must contain functions only.'
-    },
-    {
-        'testcase_name': 'sample_count_zero',
-        'stats_options_kwargs': {
-            'sample_count': 0
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid sample_count 0'
-    },
-    {
-        'testcase_name': 'sample_count_negative',
-        'stats_options_kwargs': {
-            'sample_count': -1
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid sample_count -1'
-    },
-    {
-        'testcase_name': 'both_sample_count_and_sample_rate',
-        'stats_options_kwargs': {
-            'sample_count': 100,
-            'sample_rate': 0.5
-        },
-        'exception_type': ValueError,
-        'error_message': 'Only one of sample_count or sample_rate can be '
-                         'specified.'
-    },
-    {
-        'testcase_name': 'sample_rate_zero',
-        'stats_options_kwargs': {
-            'sample_rate': 0
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid sample_rate 0'
-    },
-    {
-        'testcase_name': 'sample_rate_negative',
-        'stats_options_kwargs': {
-            'sample_rate': -1
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid sample_rate -1'
-    },
-    {
-        'testcase_name': 'sample_rate_above_one',
-        'stats_options_kwargs': {
-            'sample_rate': 2
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid sample_rate 2'
-    },
-    {
-        'testcase_name': 'num_values_histogram_buckets_one',
-        'stats_options_kwargs': {
-            'num_values_histogram_buckets': 1
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid num_values_histogram_buckets 1'
-    },
-    {
-        'testcase_name': 'num_values_histogram_buckets_zero',
-        'stats_options_kwargs': {
-            'num_values_histogram_buckets': 0
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid num_values_histogram_buckets 0'
-    },
-    {
-        'testcase_name': 'num_values_histogram_buckets_negative',
-        'stats_options_kwargs': {
-            'num_values_histogram_buckets': -1
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid num_values_histogram_buckets -1'
-    },
-    {
-        'testcase_name': 'num_histogram_buckets_negative',
-        'stats_options_kwargs': {
-            'num_histogram_buckets': -1
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid num_histogram_buckets -1'
-    },
-    {
-        'testcase_name': 'num_quantiles_histogram_buckets_negative',
-        'stats_options_kwargs': {
-            'num_quantiles_histogram_buckets': -1
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid num_quantiles_histogram_buckets -1'
-    },
-    {
-        'testcase_name': 'desired_batch_size_zero',
-        'stats_options_kwargs': {
-            'desired_batch_size': 0
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid desired_batch_size 0'
-    },
-    {
-        'testcase_name': 'desired_batch_size_negative',
-        'stats_options_kwargs': {
-            'desired_batch_size': -1
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid desired_batch_size -1'
-    },
-    {
-        'testcase_name': 'semantic_domain_stats_sample_rate_zero',
-        'stats_options_kwargs': {
-            'semantic_domain_stats_sample_rate': 0
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid semantic_domain_stats_sample_rate 0'
-    },
-    {
-        'testcase_name': 'semantic_domain_stats_sample_rate_negative',
-        'stats_options_kwargs': {
-            'semantic_domain_stats_sample_rate': -1
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid semantic_domain_stats_sample_rate -1'
-    },
-    {
-        'testcase_name': 'semantic_domain_stats_sample_rate_above_one',
-        'stats_options_kwargs': {
-            'semantic_domain_stats_sample_rate': 2
-        },
-        'exception_type': ValueError,
-        'error_message': 'Invalid semantic_domain_stats_sample_rate 2'
-    },
-]
-
-
-class StatsOptionsTest(parameterized.TestCase):
-
-  @parameterized.named_parameters(*INVALID_STATS_OPTIONS)
-  def test_stats_options(self, stats_options_kwargs, exception_type,
-                         error_message):
-    with self.assertRaisesRegexp(exception_type, error_message):
-      stats_options.StatsOptions(**stats_options_kwargs)
+# Generator and slice function used by the JSON tests. Both are immutable, so
+# they are created once and shared.
+_LIFT_GENERATOR = lift_stats_generator.LiftStatsGenerator(
+    schema=None,
+    y_path=types.FeaturePath(['label']),
+    x_paths=[types.FeaturePath(['feature'])])
+_SLICE_FUNCTION = slicing_util.get_feature_value_slicer({'b': None})
+
+# Stands in for an unset StatsOptions attribute when comparing options.
+_MISSING = object()
+
+# JSON representation of StatsOptions with default values.
+_DEFAULT_OPTIONS_JSON = """{
+  "_generators": null,
+  "_feature_whitelist": null,
+  "_schema": null,
+  "weight_feature": null,
+  "label_feature": null,
+  "_slice_functions": null,
+  "_sample_count": null,
+  "_sample_rate": null,
+  "num_top_values": 20,
+  "frequency_threshold": 1,
+  "weighted_frequency_threshold": 1.0,
+  "num_rank_histogram_buckets": 1000,
+  "_num_values_histogram_buckets": 10,
+  "_num_histogram_buckets": 10,
+  "_num_quantiles_histogram_buckets": 10,
+  "epsilon": 0.01,
+  "infer_type_from_schema": false,
+  "_desired_batch_size": null,
+  "enable_semantic_domain_stats": false,
+  "_semantic_domain_stats_sample_rate": null
+}"""
+
+# Invalid StatsOptions test cases, stored as parallel tuples of test case
+# names, constructor kwargs, expected exception types and expected error
+# messages.
+_NAMES = (
+    'invalid_generators',
+    'invalid_generator',
+    'invalid_feature_whitelist',
+    'invalid_schema',
+    'invalid_slice_functions_list',
+    'invalid_slice_function_type',
+    'sample_count_zero',
+    'sample_count_negative',
+    'both_sample_count_and_sample_rate',
+    'sample_rate_zero',
+    'sample_rate_negative',
+    'sample_rate_above_one',
+    'num_values_histogram_buckets_one',
+    'num_values_histogram_buckets_zero',
+    'num_values_histogram_buckets_negative',
+    'num_histogram_buckets_negative',
+    'num_quantiles_histogram_buckets_negative',
+    'desired_batch_size_zero',
+    'desired_batch_size_negative',
+    'semantic_domain_stats_sample_rate_zero',
+    'semantic_domain_stats_sample_rate_negative',
+    'semantic_domain_stats_sample_rate_above_one',
+)
+
+_KWARGS = (
+    {'generators': {}},
+    {'generators': [{}]},
+    {'feature_whitelist': {}},
+    {'schema': {}},
+    {'slice_functions': {}},
+    {'slice_functions': [1]},
+    {'sample_count': 0},
+    {'sample_count': -1},
+    {'sample_count': 100, 'sample_rate': 0.5},
+    {'sample_rate': 0},
+    {'sample_rate': -1},
+    {'sample_rate': 2},
+    {'num_values_histogram_buckets': 1},
+    {'num_values_histogram_buckets': 0},
+    {'num_values_histogram_buckets': -1},
+    {'num_histogram_buckets': -1},
+    {'num_quantiles_histogram_buckets': -1},
+    {'desired_batch_size': 0},
+    {'desired_batch_size': -1},
+    {'semantic_domain_stats_sample_rate': 0},
+    {'semantic_domain_stats_sample_rate': -1},
+    {'semantic_domain_stats_sample_rate': 2},
+)
+
+_EXC_TYPES = (
+    TypeError,
+    TypeError,
+    TypeError,
+    TypeError,
+    TypeError,
+    TypeError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+    ValueError,
+)
+
+# The expected error messages are literal strings, so they are escaped and
+# compiled once at import.
+_MESSAGES = tuple(
+    re.compile(re.escape(message)) for message in (
+        'generators is of type dict, should be a list.',
+        'Statistics generator must extend one of '
+        'CombinerStatsGenerator, TransformStatsGenerator, '
+        'or CombinerFeatureStatsGenerator '
+        'found object of type dict.',
+        'feature_whitelist is of type dict, should be a list.',
+        'schema is of type dict, should be a Schema proto.',
+        'slice_functions is of type dict, should be a list.',
+        'slice_functions must contain functions only.',
+        'Invalid sample_count 0',
+        'Invalid sample_count -1',
+        'Only one of sample_count or sample_rate can be '
+        'specified.',
+        'Invalid sample_rate 0',
+        'Invalid sample_rate -1',
+        'Invalid sample_rate 2',
+        'Invalid num_values_histogram_buckets 1',
+        'Invalid num_values_histogram_buckets 0',
+        'Invalid num_values_histogram_buckets -1',
+        'Invalid num_histogram_buckets -1',
+        'Invalid num_quantiles_histogram_buckets -1',
+        'Invalid desired_batch_size 0',
+        'Invalid desired_batch_size -1',
+        'Invalid semantic_domain_stats_sample_rate 0',
+        'Invalid semantic_domain_stats_sample_rate -1',
+        'Invalid semantic_domain_stats_sample_rate 2',
+    ))
+
+# zip would silently drop cases if the tuples got out of sync.
+assert len(_NAMES) == len(_KWARGS) == len(_EXC_TYPES) == len(_MESSAGES)
+
+
+class StatsOptionsTest(absltest.TestCase):
+
+  def test_invalid_stats_options(self):
+    for name, stats_options_kwargs, exception_type, error_message in zip(
+        _NAMES, _KWARGS, _EXC_TYPES, _MESSAGES):
+      with self.subTest(name):
+        with self.assertRaisesRegex(exception_type, error_message):
+          stats_options.StatsOptions(**stats_options_kwargs)
+
+  def test_stats_options_to_json(self):
+    generators = [_LIFT_GENERATOR]
+    slice_functions = [_SLICE_FUNCTION]
+    options = stats_options.StatsOptions(
+        generators=generators, slice_functions=slice_functions)
+    options_json = options.to_json()
+    # to_json writes compact separators (no whitespace after ':' or ',') with
+    # both orjson and the json fallback.
+    self.assertIn('"_generators":null', options_json)
+    self.assertIn('"_slice_functions":null', options_json)
+
+  def test_stats_options_to_json_non_ascii(self):
+    options = stats_options.StatsOptions(feature_whitelist=[u'caf\u00e9'])
+    options_json = options.to_json()
+    self.assertIn(u'"caf\u00e9"', options_json)
+    options = stats_options.StatsOptions.from_json(options_json)
+    self.assertEqual([u'caf\u00e9'], options.feature_whitelist)
+
+  def test_stats_options_json_round_trip_nan(self):
+    options = stats_options.StatsOptions(epsilon=float('nan'))
+    options = stats_options.StatsOptions.from_json(options.to_json())
+    self.assertTrue(math.isnan(options.epsilon))
+
+  def test_stats_options_json_round_trip_large_int(self):
+    options = stats_options.StatsOptions(num_top_values=2**70)
+    options = stats_options.StatsOptions.from_json(options.to_json())
+    self.assertEqual(2**70, options.num_top_values)
+    self.assertIsInstance(options.num_top_values, int)
 
   def test_stats_options_json_round_trip(self):
-    generators = [
-        lift_stats_generator.LiftStatsGenerator(
-            schema=None,
-            y_path=types.FeaturePath(['label']),
-            x_paths=[types.FeaturePath(['feature'])])
-    ]
+    generators = [_LIFT_GENERATOR]
     feature_whitelist = ['a']
     schema = schema_pb2.Schema(feature=[schema_pb2.Feature(name='f')])
     label_feature = 'label'
     weight_feature = 'weight'
-    slice_functions = [slicing_util.get_feature_value_slicer({'b': None})]
+    slice_functions = [_SLICE_FUNCTION]
     sample_rate = 0.01
     num_top_values = 21
     frequency_threshold = 2
@@ -270,6 +261,9 @@ class StatsOptionsTest(parameterized.TestCase):
     options_json = options.to_json()
     options = stats_options.StatsOptions.from_json(options_json)
 
+    # to_json emits attributes in a fixed order, so decoding and re-encoding
+    # must reproduce the same text.
+    self.assertEqual(options_json, options.to_json())
     self.assertIsNone(options.generators)
     self.assertEqual(feature_whitelist, options.feature_whitelist)
     compare.assertProtoEqual(self, schema, options.schema)
@@ -297,31 +291,45 @@ class StatsOptionsTest(parameterized.TestCase):
                      options.semantic_domain_stats_sample_rate)
 
   def test_stats_options_from_json(self):
-    options_json = """{
-      "_generators": null,
-      "_feature_whitelist": null,
-      "_schema": null,
-      "weight_feature": null,
-      "label_feature": null,
-      "_slice_functions": null,
-      "_sample_count": null,
-      "_sample_rate": null,
-      "num_top_values": 20,
-      "frequency_threshold": 1,
-      "weighted_frequency_threshold": 1.0,
-      "num_rank_histogram_buckets": 1000,
-      "_num_values_histogram_buckets": 10,
-      "_num_histogram_buckets": 10,
-      "_num_quantiles_histogram_buckets": 10,
-      "epsilon": 0.01,
-      "infer_type_from_schema": false,
-      "_desired_batch_size": null,
-      "enable_semantic_domain_stats": false,
-      "_semantic_domain_stats_sample_rate": null
-    }"""
-    actual_options = stats_options.StatsOptions.from_json(options_json)
-    expected_options_dict = stats_options.StatsOptions().__dict__
-    self.assertEqual(expected_options_dict, actual_options.__dict__)
+    actual_options = stats_options.StatsOptions.from_json(
+        _DEFAULT_OPTIONS_JSON)
+    expected_options = stats_options.StatsOptions()
+    diff = {
+        k: (getattr(expected_options, k, _MISSING),
+            getattr(actual_options, k, _MISSING))
+        for k in stats_options.StatsOptions.__slots__
+        if (getattr(expected_options, k, _MISSING) !=
+            getattr(actual_options, k, _MISSING))
+    }
+    self.assertFalse(diff, diff)
+
+  def test_stats_options_from_json_ignores_unknown_fields(self):
+    options_json = '{"unknown_option": 1,' + _DEFAULT_OPTIONS_JSON[1:]
+    options = stats_options.StatsOptions.from_json(options_json)
+    self.assertFalse(hasattr(options, 'unknown_option'))
+    self.assertEqual(stats_options.StatsOptions().to_json(), options.to_json())
+
+  def test_stats_options_subclass_json_round_trip(self):
+
+    class _CustomStatsOptions(stats_options.StatsOptions):
+      pass
+
+    options = _CustomStatsOptions(num_top_values=21)
+    options.custom_option = 'custom'
+    options = _CustomStatsOptions.from_json(options.to_json())
+    self.assertEqual(21, options.num_top_values)
+    self.assertEqual('custom', options.custom_option)
+
+  def test_stats_options_subclass_with_slots_json_round_trip(self):
+
+    class _CustomStatsOptions(stats_options.StatsOptions):
+      __slots__ = ('custom_option',)
+
+    options = _CustomStatsOptions(num_top_values=21)
+    options.custom_option = 'custom'
+    options = _CustomStatsOptions.from_json(options.to_json())
+    self.assertEqual(21, options.num_top_values)
+    self.assertEqual('custom', options.custom_option)
 
 
 if __name__ == '__main__':
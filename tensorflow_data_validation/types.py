@@ -18,6 +18,8 @@ from __future__ import division
 
 from __future__ import print_function
 
+import functools
+
 import apache_beam as beam
 import numpy as np
 import pyarrow as pa
@@ -91,9 +93,15 @@ class FeaturePath(object):
 
   __slot__ = ["_steps"]
 
-  def __init__(self, steps: Iterable[FeatureName]):
-    self._steps = tuple(
-        s if isinstance(s, six.text_type) else s.decode("utf-8") for s in steps)
+  # There is no __init__: __new__ sets _steps on the (possibly cached)
+  # instance, and object.__init__ ignores the constructor arguments.
+  def __new__(cls, steps: Iterable[FeatureName]) -> "FeaturePath":
+    # FeaturePaths are immutable, so equal paths share a single instance.
+    return _make_feature_path(cls, tuple(
+        s if isinstance(s, six.text_type) else s.decode("utf-8") for s in steps))
+
+  def __reduce__(self):
+    return self.__class__, (self._steps,)
 
   def to_proto(self) -> path_pb2.Path:
     return path_pb2.Path(step=self._steps)
@@ -133,3 +141,11 @@ class FeaturePath(object):
 
   def __bool__(self) -> bool:
     return bool(self._steps)
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_feature_path(cls, steps: Tuple[Text, ...]) -> FeaturePath:
+  """Creates a FeaturePath of type cls, reusing instances for equal steps."""
+  feature_path = object.__new__(cls)
+  feature_path._steps = steps  # pylint: disable=protected-access
+  return feature_path
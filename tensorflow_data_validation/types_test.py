@@ -0,0 +1,66 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for types."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import copy
+import pickle
+
+from absl.testing import absltest
+from tensorflow_data_validation import types
+
+from tensorflow_metadata.proto.v0 import path_pb2
+
+
+class FeaturePathTest(absltest.TestCase):
+
+  def test_equal_paths_are_interned(self):
+    self.assertIs(types.FeaturePath(['a']), types.FeaturePath([b'a']))
+    self.assertIs(types.FeaturePath(['a', 'b']), types.FeaturePath(('a', 'b')))
+    self.assertIsNot(types.FeaturePath(['a']), types.FeaturePath(['b']))
+
+  def test_pickle_round_trip(self):
+    path = types.FeaturePath(['a', 'b'])
+    unpickled = pickle.loads(pickle.dumps(path))
+    self.assertEqual(path, unpickled)
+    self.assertIs(path, unpickled)
+
+  def test_deepcopy(self):
+    path = types.FeaturePath(['a', 'b'])
+    copied = copy.deepcopy(path)
+    self.assertEqual(path, copied)
+    self.assertIs(path, copied)
+
+  def test_parent_and_child(self):
+    path = types.FeaturePath(['a', 'b'])
+    self.assertEqual(('a',), path.parent().steps())
+    self.assertIs(types.FeaturePath(['a']), path.parent())
+    self.assertEqual(('a', 'b', 'c'), path.child('c').steps())
+    self.assertEqual(('a', 'b', 'c'), path.child(b'c').steps())
+    self.assertIs(path, path.child('c').parent())
+    with self.assertRaisesRegex(ValueError, 'Root does not have parent.'):
+      types.FeaturePath([]).parent()
+
+  def test_proto_round_trip(self):
+    path = types.FeaturePath(['a', 'b'])
+    path_proto = path.to_proto()
+    self.assertEqual(path_pb2.Path(step=['a', 'b']), path_proto)
+    self.assertIs(path, types.FeaturePath.from_proto(path_proto))
+
+
+if __name__ == '__main__':
+  absltest.main()